@@ -8,13 +8,12 @@ from gypsum.antenna_sample_provider import SampleProviderAttributes
 from gypsum.config import ACQUISITION_INTEGRATED_CORRELATION_STRENGTH_DETECTION_THRESHOLD
 from gypsum.gps_ca_prn_codes import GpsSatelliteId
 from gypsum.satellite import GpsSatellite
-from gypsum.units import CarrierWavePhaseInRadians, PrnCodePhaseInSamples
+from gypsum.units import CarrierWavePhaseInRadians, PrnCodePhaseInSamples, PrnReplicaCodeConjugateFftSpanningOneMs
 from gypsum.utils import (
     AntennaSamplesSpanningAcquisitionIntegrationPeriodMs,
     CorrelationProfile,
     DopplerShiftHz,
     IntegrationType,
-    PrnReplicaCodeSamplesSpanningOneMs,
     integrate_correlation_with_doppler_shifted_prn,
 )
 from gypsum.utils import get_normalized_correlation_peak_strength
@@ -124,7 +123,7 @@ class GpsSatelliteDetector:
             samples_for_integration_period,
             stream_attributes,
             best_doppler_shift,
-            self.satellites_by_id[satellite_id].prn_as_complex,  # type: ignore
+            self.satellites_by_id[satellite_id].prn_conjugate_fft,  # type: ignore
         )
 
         # Rely on the correlation peak index that comes from non-coherent integration, since it'll be stronger and
@@ -172,7 +171,7 @@ class GpsSatelliteDetector:
                 antenna_data,
                 stream_attributes,
                 doppler_shift,
-                self.satellites_by_id[satellite_id].prn_as_complex,  # type: ignore
+                self.satellites_by_id[satellite_id].prn_conjugate_fft,  # type: ignore
             )
             doppler_shift_to_correlation_profile[doppler_shift] = correlation_profile
 
@@ -195,12 +194,12 @@ class GpsSatelliteDetector:
         antenna_data: AntennaSamplesSpanningAcquisitionIntegrationPeriodMs,
         stream_attributes: SampleProviderAttributes,
         doppler_shift: DopplerShiftHz,
-        prn_as_complex: PrnReplicaCodeSamplesSpanningOneMs,
+        prn_conjugate_fft: PrnReplicaCodeConjugateFftSpanningOneMs,
     ) -> CorrelationProfile:
         # Ref: https://stackoverflow.com/questions/16589791/most-efficient-property-to-hash-for-numpy-array
         # antenna_data.sum() will have a higher chance of collisions than .tostring(), but it's faster,
         # and I'm willing to take the chance.
-        key = hash((integration_type, hash(antenna_data.sum()), doppler_shift, hash(prn_as_complex.tostring())))  # type: ignore
+        key = hash((integration_type, hash(antenna_data.sum()), doppler_shift, hash(prn_conjugate_fft.tostring())))  # type: ignore
         # TODO(PT): Note cache is currently disabled to rule it out as a confounding factor
         if False and key in self._cached_correlation_profiles:
             _logger.debug(f"Did hit cache for PRN correlation result")
@@ -213,7 +212,7 @@ class GpsSatelliteDetector:
             antenna_data,
             stream_attributes,
             doppler_shift,
-            prn_as_complex,
+            prn_conjugate_fft,
         )
         self._cached_correlation_profiles[key] = correlation_profile
         return correlation_profile
@@ -1,13 +1,18 @@
 import logging
 from dataclasses import dataclass
-from typing import Any
+from functools import cache
+from pathlib import Path
 
 import numpy as np
 
 _logger = logging.getLogger(__name__)
 
+# The replica PRNs are fixed by the GPS specification, so they're generated ahead of time and shipped with the code.
+# Regenerate with `invoke generate-replica-prns`.
+_REPLICA_PRNS_PATH = Path(__file__).parent / "resources" / "replica_prns.npy"
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ChipDelayMs:
     """New-type to represent the delay assigned to a given GPS satellite PRN.
     Each chip is transmitted over 1 millisecond, so the chip delay is directly expressed in milliseconds.
@@ -15,123 +20,68 @@ class ChipDelayMs:
 
     delay_ms: int
 
-    def __init__(self, delay_ms: int) -> None:
-        self.delay_ms = delay_ms
-
-
-@dataclass
-class G2SequenceTapsConfiguration:
-    taps: list[int]
-
-    def __init__(self, taps: list[int]) -> None:
-        self.taps = taps
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GpsSatelliteId:
     """New-type to semantically store GPS satellite IDs by their PRN signal ID"""
 
     id: int
 
-    def __init__(self, id: int) -> None:
-        self.id = id
-
-    def __hash__(self) -> int:
-        return hash(self.id)
-
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, type(self)):
-            return False
-        return self.id == other.id
-
 
 @dataclass
 class GpsReplicaPrnSignal:
-    """New-type to semantically store the 'replica' PRN signal for a given satellite"""
+    """New-type to semantically store the 'replica' PRN signal for a given satellite.
+    The chips are stored in their BPSK form as int8 (a 0 chip is -1, and a 1 chip is 1), matching the [-1 to 1] range of
+    the antenna data they're correlated against.
+    """
 
     inner: np.ndarray
 
 
-def _generate_ca_code_rolled_by(delay_ms: int) -> np.ndarray:
-    """Generate the C/A code by generating the 'G1' and 'G2' sequences, then mixing them.
-    Note that we generate the 'pure' G2 code, then roll it by `delay_ms` chips before mixing. This code is only ever
-    used in the context of the PRN for a particular GPS satellite, so we don't need to access it pre-roll (though it's
-    fine to pass `delay_ms=0` if this is desired.
+# Parity (mod-2 sum of set bits) of every possible 10-bit register state
+_PARITY_OF_10_BIT_STATE = bytes([bin(i).count("1") & 1 for i in range(1 << 10)])
+
+
+def _register_mask_for_stages(stages: list[int]) -> int:
+    """Shift register stages are numbered from 1, and stage N is held in bit N-1 of the register integer"""
+    mask = 0
+    for stage in stages:
+        mask |= 1 << (stage - 1)
+    return mask
+
+
+# G1 = X^10 + X^3 + 1
+_G1_FEEDBACK_MASK = _register_mask_for_stages([3, 10])
+# G2 = X^10 + X^9 + X^8 + X^6 + X^3 + X^2 + 1
+_G2_FEEDBACK_MASK = _register_mask_for_stages([2, 3, 6, 8, 9, 10])
 
-    Note that the signal generated by this function needs further post-processing (to adjust its domain and range)
-    before it represents a replica PRN signal.
+
+def _generate_lfsr_sequence(feedback_mask: int) -> np.ndarray:
+    """Generate one full period of a 10-stage shift register's output (taken from stage 10), with the register
+    held as a 10-bit integer. Shifting the register 'to the right' (from stage N to stage N+1) is a left shift of the
+    integer, and the feedback bit is shifted into stage 1.
 
     Ref: IS-GPS-200L §3.3.2.3: C/A-Code Generation
     """
-    seq_bit_count = 10
-    # PT: I'm out of my depth here, but it appears as though the scipy implementation needs to be passed the 'companion
-    # set' of taps to produce the correct output sequence.
-    #
-    # If I'm understanding correctly, the GPS documentation specifies the taps in 'Galois generator' form, while the
-    # scipy implementation needs to be provided the taps in 'Fibonacci generator' form.
-    # Further reading: https://web.archive.org/web/20181001062252/http://www.newwaveinstruments.com/resources/articles/m_sequence_linear_feedback_shift_register_lfsr.htm
-    #
-    # Another way of understanding this which may also be correct: the GPS documentation vs. software libraries simply
-    # describe the shift register in different orders from each other.
-    #
-    # (Terms 1 and X^n can be omitted as they're implicit.
-    # X^n can be omitted because it'll be evaluated as 2^(x-x), which is zero anyway.)
-    #
-    try:
-        from scipy.signal import max_len_seq
-    except ImportError:
-        raise RuntimeError("This code path is unused, and if you want to try it you'll need to install scipy.")
-    # G1 = X^10 + X^3 + 1
-    g1 = max_len_seq(seq_bit_count, taps=[seq_bit_count - 3])[0]
-    # G2 = X^10 + X^9 + X^8 + X^6 + X^3 + X^2 + 1
-    g2 = max_len_seq(
-        seq_bit_count,
-        taps=[
-            seq_bit_count - 9,
-            seq_bit_count - 8,
-            seq_bit_count - 6,
-            seq_bit_count - 3,
-            seq_bit_count - 2,
-        ],
-    )[0]
-    return np.bitwise_xor(g1, np.roll(g2, delay_ms))
-
-
-def _shift_reg(register: list[int], feedback: list[int], output: list[int]) -> int:
-    """Shift register, noting which indexes should be considered feedback, and which as outputs"""
-    out = [register[i - 1] for i in output]
-    if len(out) > 1:
-        out = sum(out) % 2
-    else:
-        out = out[0]
-
-    # Add in feedback, mod2
-    fb = sum([register[i - 1] for i in feedback]) % 2
-
-    # shift to the right
-    for i in reversed(range(len(register[1:]))):
-        register[i + 1] = register[i]
-
-    # Return feedback in the first slot
-    register[0] = fb
-    return out
-
-
-def _generate_ca_code_with_taps(taps: list[int]) -> np.ndarray:
-    g1_reg = [1 for _ in range(10)]
-    g2_reg = [1 for _ in range(10)]
-
-    prn_code = []
-    for _ in range(1023):
-        g1_val = _shift_reg(g1_reg, [3, 10], [10])
-        g2_val = _shift_reg(g2_reg, [2, 3, 6, 8, 9, 10], taps)
-
-        prn_code.append((g1_val + g2_val) % 2)
-
-    return np.array(prn_code)
+    # This loop is deliberately left in plain Python. It runs twice per regeneration of the replica PRNs asset (and
+    # never at receiver runtime), so a JIT's compile time would far outweigh the ~2000 iterations it'd speed up.
+    # For the same reason, the register is clocked one chip at a time: a table that advances it 8 chips per lookup would
+    # need 8 * 1024 steps to build, far more than the 1023 it'd save.
+    parity = _PARITY_OF_10_BIT_STATE
+    register_mask = (1 << 10) - 1
+    output_mask = _register_mask_for_stages([10])
 
+    # The register is initialised to all ones
+    register = register_mask
+    sequence = np.empty(1023, dtype=np.uint8)
+    for i in range(1023):
+        sequence[i] = parity[register & output_mask]
+        register = ((register << 1) | parity[register & feedback_mask]) & register_mask
 
-def generate_replica_prn_signals() -> dict[GpsSatelliteId, GpsReplicaPrnSignal]:
+    return sequence
+
+
+def _generate_replica_prns() -> dict[GpsSatelliteId, np.ndarray]:
     _logger.info(f"Generating replica PRN signals for satellites 1 through 32...")
     # Ref: https://www.gps.gov/technical/icwg/IS-GPS-200L.pdf
     # Table 3-Ia. Code Phase Assignments
@@ -142,52 +92,83 @@ def generate_replica_prn_signals() -> dict[GpsSatelliteId, GpsReplicaPrnSignal]:
     # In other words, the C/A code for each satellite is a time-shifted version of the same signal, and the
     # delay is expressed in terms of a number of chips (each of which occupies 1ms).
     # PT: The above comment is wrong, the *total 1023-chip PRN* is transmitted every 1ms!
-    satellite_id_to_g2_sequence_tap_configuration = {
-        GpsSatelliteId(1): G2SequenceTapsConfiguration([2, 6]),
-        GpsSatelliteId(2): G2SequenceTapsConfiguration([3, 7]),
-        GpsSatelliteId(3): G2SequenceTapsConfiguration([4, 8]),
-        GpsSatelliteId(4): G2SequenceTapsConfiguration([5, 9]),
-        GpsSatelliteId(5): G2SequenceTapsConfiguration([1, 9]),
-        GpsSatelliteId(6): G2SequenceTapsConfiguration([2, 10]),
-        GpsSatelliteId(7): G2SequenceTapsConfiguration([1, 8]),
-        GpsSatelliteId(8): G2SequenceTapsConfiguration([2, 9]),
-        GpsSatelliteId(9): G2SequenceTapsConfiguration([3, 10]),
-        GpsSatelliteId(10): G2SequenceTapsConfiguration([2, 3]),
-        GpsSatelliteId(11): G2SequenceTapsConfiguration([3, 4]),
-        GpsSatelliteId(12): G2SequenceTapsConfiguration([5, 6]),
-        GpsSatelliteId(13): G2SequenceTapsConfiguration([6, 7]),
-        GpsSatelliteId(14): G2SequenceTapsConfiguration([7, 8]),
-        GpsSatelliteId(15): G2SequenceTapsConfiguration([8, 9]),
-        GpsSatelliteId(16): G2SequenceTapsConfiguration([9, 10]),
-        GpsSatelliteId(17): G2SequenceTapsConfiguration([1, 4]),
-        GpsSatelliteId(18): G2SequenceTapsConfiguration([2, 5]),
-        GpsSatelliteId(19): G2SequenceTapsConfiguration([3, 6]),
-        GpsSatelliteId(20): G2SequenceTapsConfiguration([4, 7]),
-        GpsSatelliteId(21): G2SequenceTapsConfiguration([5, 8]),
-        GpsSatelliteId(22): G2SequenceTapsConfiguration([6, 9]),
-        GpsSatelliteId(23): G2SequenceTapsConfiguration([1, 3]),
-        GpsSatelliteId(24): G2SequenceTapsConfiguration([4, 6]),
-        GpsSatelliteId(25): G2SequenceTapsConfiguration([5, 7]),
-        GpsSatelliteId(26): G2SequenceTapsConfiguration([6, 8]),
-        GpsSatelliteId(27): G2SequenceTapsConfiguration([7, 9]),
-        GpsSatelliteId(28): G2SequenceTapsConfiguration([8, 10]),
-        GpsSatelliteId(29): G2SequenceTapsConfiguration([1, 6]),
-        GpsSatelliteId(30): G2SequenceTapsConfiguration([2, 7]),
-        GpsSatelliteId(31): G2SequenceTapsConfiguration([3, 8]),
-        GpsSatelliteId(32): G2SequenceTapsConfiguration([4, 9]),
+    satellite_id_to_g2_chip_delay = {
+        GpsSatelliteId(1): ChipDelayMs(5),
+        GpsSatelliteId(2): ChipDelayMs(6),
+        GpsSatelliteId(3): ChipDelayMs(7),
+        GpsSatelliteId(4): ChipDelayMs(8),
+        GpsSatelliteId(5): ChipDelayMs(17),
+        GpsSatelliteId(6): ChipDelayMs(18),
+        GpsSatelliteId(7): ChipDelayMs(139),
+        GpsSatelliteId(8): ChipDelayMs(140),
+        GpsSatelliteId(9): ChipDelayMs(141),
+        GpsSatelliteId(10): ChipDelayMs(251),
+        GpsSatelliteId(11): ChipDelayMs(252),
+        GpsSatelliteId(12): ChipDelayMs(254),
+        GpsSatelliteId(13): ChipDelayMs(255),
+        GpsSatelliteId(14): ChipDelayMs(256),
+        GpsSatelliteId(15): ChipDelayMs(257),
+        GpsSatelliteId(16): ChipDelayMs(258),
+        GpsSatelliteId(17): ChipDelayMs(469),
+        GpsSatelliteId(18): ChipDelayMs(470),
+        GpsSatelliteId(19): ChipDelayMs(471),
+        GpsSatelliteId(20): ChipDelayMs(472),
+        GpsSatelliteId(21): ChipDelayMs(473),
+        GpsSatelliteId(22): ChipDelayMs(474),
+        GpsSatelliteId(23): ChipDelayMs(509),
+        GpsSatelliteId(24): ChipDelayMs(512),
+        GpsSatelliteId(25): ChipDelayMs(513),
+        GpsSatelliteId(26): ChipDelayMs(514),
+        GpsSatelliteId(27): ChipDelayMs(515),
+        GpsSatelliteId(28): ChipDelayMs(516),
+        GpsSatelliteId(29): ChipDelayMs(859),
+        GpsSatelliteId(30): ChipDelayMs(860),
+        GpsSatelliteId(31): ChipDelayMs(861),
+        GpsSatelliteId(32): ChipDelayMs(862),
     }
 
     # Generate each pure PRN signal.
-    # Then, translate and scale each signal to match the representation used in BPSK.
+    # Note each signal has exactly 1023 data points (which is the correct/exact length of the G2 code).
+    # G1 is shared by every satellite, and each satellite's G2i is the same G2 sequence delayed by some chips, so
+    # each register only needs to be clocked once. All 32 PRNs are then mixed at once.
+    g1 = _generate_lfsr_sequence(_G1_FEEDBACK_MASK)
+    g2 = _generate_lfsr_sequence(_G2_FEEDBACK_MASK)
+    # Gather every delayed G2 in one go: row i holds G2 delayed by satellite i's chip delay (like np.roll(g2, delay)).
+    chip_delays = np.array([chip_delay.delay_ms for chip_delay in satellite_id_to_g2_chip_delay.values()])
+    g2_delayed = g2[(np.arange(len(g2))[np.newaxis, :] - chip_delays[:, np.newaxis]) % len(g2)]
+    prns = np.bitwise_xor(g1[np.newaxis, :], g2_delayed)
+    return dict(zip(satellite_id_to_g2_chip_delay.keys(), prns))
+
+
+def write_replica_prns_asset() -> None:
+    """Generate and validate the replica PRNs, then write them to the asset loaded by generate_replica_prn_signals()"""
+    prns = _generate_replica_prns()
+    # Translate and scale each signal to match the representation used in BPSK.
     # In particular, the domain of the generated signals start out at [0 to 1].
     # Antenna data will instead vary from [-1 to 1].
-    # Note each signal has exactly 1023 data points (which is the correct/exact length of the G2 code).
-    output = {
-        sat_id: (GpsReplicaPrnSignal(_generate_ca_code_with_taps(prn_tap_configs.taps)))
-        for sat_id, prn_tap_configs in satellite_id_to_g2_sequence_tap_configuration.items()
-    }
+    prn_matrix = (2 * np.stack([prns[GpsSatelliteId(i + 1)] for i in range(len(prns))]).astype(np.int8)) - 1
+    _validate_replica_prn_signals({GpsSatelliteId(i + 1): GpsReplicaPrnSignal(prn) for i, prn in enumerate(prn_matrix)})
+    _REPLICA_PRNS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    np.save(_REPLICA_PRNS_PATH, prn_matrix)
+    _logger.info(f"Wrote {len(prns)} replica PRNs to {_REPLICA_PRNS_PATH}")
+
 
-    # Immediately verify that the PRNs were generated correctly
+@cache
+def generate_replica_prn_signals() -> dict[GpsSatelliteId, GpsReplicaPrnSignal]:
+    """The PRNs are fixed by the GPS specification, so they're loaded from the pregenerated asset once per process"""
+    prn_matrix = np.load(_REPLICA_PRNS_PATH)
+    output = {GpsSatelliteId(i + 1): GpsReplicaPrnSignal(prn) for i, prn in enumerate(prn_matrix)}
+
+    if __debug__:
+        # Verify that the asset holds the PRNs we expect
+        _validate_replica_prn_signals(output)
+
+    _logger.info(f"Loaded {len(output)} replica PRNs.")
+    return output
+
+
+def _validate_replica_prn_signals(output: dict[GpsSatelliteId, GpsReplicaPrnSignal]) -> None:
+    """Check the first 10 chips of each generated PRN against the octal test vectors given in IS-GPS-200L Table 3-Ia"""
     _logger.info(f"Validating watermarks of generated PRNs...")
     expected_prn_starting_markers = {
         GpsSatelliteId(1): 1440,
@@ -223,28 +204,14 @@ def generate_replica_prn_signals() -> dict[GpsSatelliteId, GpsReplicaPrnSignal]:
         GpsSatelliteId(31): 1625,
         GpsSatelliteId(32): 1712,
     }
+    # Each test vector is the first 10 chips of the PRN, written in octal (so the leading digit holds a single chip).
+    # Pack the first 10 chips of each PRN into an integer in the same order, so each PRN can be checked in one compare.
+    first_chips_weights = 1 << np.arange(9, -1, -1)
     for satellite_id, expected_prn_start in expected_prn_starting_markers.items():
-        prn = output[satellite_id].inner
-        expected_prn_start_octal_digits = str(expected_prn_start)
-        # The PRN needs to always start high
-        if expected_prn_start_octal_digits[0] != "1":
-            raise ValueError(f"Test vector PRN is always expected to begin with 1")
-        if prn[0] != 1:
-            raise ValueError(f"Generated PRNs always need to start with 1")
-
-        # Skip the starting 1
-        expected_prn_start_octal_digits = expected_prn_start_octal_digits[1:]
-        prn = prn[1:]
-
-        for digit_idx, expected_prn_octal_digit in enumerate(expected_prn_start_octal_digits):
-            actual_prn_bits_start_idx = digit_idx * 3
-            actual_prn_octal_digit = int(
-                "".join([str(bit) for bit in prn[actual_prn_bits_start_idx : actual_prn_bits_start_idx + 3]]), 2
+        # Recover the [0 to 1] chips from the BPSK representation
+        first_chips = output[satellite_id].inner[:10] > 0
+        actual_prn_start = int(first_chips @ first_chips_weights)
+        if actual_prn_start != int(str(expected_prn_start), 8):
+            raise ValueError(
+                f"SV {satellite_id.id}: PRN start {actual_prn_start:o} didn't match expected start {expected_prn_start}"
             )
-            if actual_prn_octal_digit != int(expected_prn_octal_digit):
-                raise ValueError(
-                    f"SV {satellite_id.id}: PRN digit {actual_prn_octal_digit} didn't match expected digit {expected_prn_octal_digit}"
-                )
-
-    _logger.info(f"Finished generating and validating {len(output)} replica PRNs.")
-    return output
@@ -4,6 +4,7 @@ from functools import lru_cache
 import numpy as np
 
 from gypsum.gps_ca_prn_codes import GpsReplicaPrnSignal, GpsSatelliteId
+from gypsum.utils import get_prn_replica_conjugate_fft
 
 ALL_SATELLITE_IDS = [GpsSatelliteId(i + 1) for i in range(32)]
 
@@ -23,9 +24,31 @@ class GpsSatellite:
         # We're going to try to correlate our generated PRN with the samples coming in from our radio, so we need to
         # resample our generated PRN to match however many samples we expect the received PRN to occupy.
         # TODO(PT): Perhaps this should own the calculation for the scale factor, once we can resample fractionally?
+        # Note that the replica PRN is already in the [-1, 1] domain of the IQ samples we'll receive.
         prn_with_repeated_data_points = np.repeat(self.prn_code.inner, self.scale_factor)
-        # Adjust domain from [0 - 1] to [-1, 1] to match the IQ samples we'll receive
-        prn_with_adjusted_domain = np.array([-1 if chip == 0 else 1 for chip in prn_with_repeated_data_points])
         # Convert to complex with a zero imaginary part
-        prn_as_complex = prn_with_adjusted_domain.astype(complex)
+        prn_as_complex = prn_with_repeated_data_points.astype(complex)
         return prn_as_complex
+
+    @property
+    @lru_cache
+    def prn_as_complex_spanning_two_prns(self) -> np.ndarray:
+        # Two back-to-back copies of the replica, so that any phase shift of it can be sliced out without a copy.
+        # The slices handed out are views into this shared buffer, so make sure nobody can modify it in-place.
+        prn_as_complex_spanning_two_prns = np.tile(self.prn_as_complex, 2)  # type: ignore
+        prn_as_complex_spanning_two_prns.setflags(write=False)
+        return prn_as_complex_spanning_two_prns
+
+    def prn_as_complex_rolled_by(self, phase_shift: int) -> np.ndarray:
+        # Equivalent to np.roll(self.prn_as_complex, phase_shift), but returns a view rather than allocating a new
+        # array. The tracker needs several phase shifts of the replica every millisecond.
+        prn_length = len(self.prn_as_complex)  # type: ignore
+        start = -phase_shift % prn_length
+        return self.prn_as_complex_spanning_two_prns[start : start + prn_length]  # type: ignore
+
+    @property
+    @lru_cache
+    def prn_conjugate_fft(self) -> np.ndarray:
+        # Acquisition correlates the same replica against every chunk of antenna data, at every Doppler shift it
+        # searches, so transform it to the frequency domain once up front.
+        return get_prn_replica_conjugate_fft(self.prn_as_complex)  # type: ignore
@@ -281,14 +281,14 @@ class GpsSatelliteTracker:
         doppler_shifted_samples = receiver_samples_chunk.samples * doppler_shift_carrier
 
         # Correlate early, prompt, and late phase versions of the PRN
-        unslid_prn = params.satellite.prn_as_complex
+        satellite = params.satellite
         orig_prn_code_phase_shift = params.current_prn_code_phase_shift
-        prompt_prn = np.roll(unslid_prn, orig_prn_code_phase_shift)  # type: ignore
+        prompt_prn = satellite.prn_as_complex_rolled_by(orig_prn_code_phase_shift)
 
         # Starting point comes 'backward' one chip
-        early = np.roll(unslid_prn, orig_prn_code_phase_shift-1)
+        early = satellite.prn_as_complex_rolled_by(orig_prn_code_phase_shift-1)
         # Starting point goes 'forward' one chip
-        late = np.roll(unslid_prn, orig_prn_code_phase_shift+1)
+        late = satellite.prn_as_complex_rolled_by(orig_prn_code_phase_shift+1)
 
         early_corr = np.correlate(doppler_shifted_samples, early)
         # prompt_corr = np.correlate(doppler_shifted_samples, prompt_prn)
@@ -16,6 +16,7 @@ Percent = float
 AntennaSamplesSpanningAcquisitionIntegrationPeriodMs = np.ndarray
 AntennaSamplesSpanningOneMs = np.ndarray
 PrnReplicaCodeSamplesSpanningOneMs = np.ndarray
+PrnReplicaCodeConjugateFftSpanningOneMs = np.ndarray
 
 CorrelationProfile = np.ndarray
 CoherentCorrelationProfile = CorrelationProfile
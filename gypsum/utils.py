@@ -10,6 +10,7 @@ from gypsum.units import (
     AntennaSamplesSpanningOneMs,
     CorrelationProfile,
     DopplerShiftHz,
+    PrnReplicaCodeConjugateFftSpanningOneMs,
     PrnReplicaCodeSamplesSpanningOneMs,
 )
 from gypsum.units import CorrelationStrengthRatio
@@ -56,17 +57,32 @@ def does_list_contain_sublist(li: list[Any], sub: list[Any]) -> bool:
 DEBUG = False
 
 
+def get_prn_replica_conjugate_fft(
+    prn_replica: PrnReplicaCodeSamplesSpanningOneMs,
+) -> PrnReplicaCodeConjugateFftSpanningOneMs:
+    return np.conj(np.fft.fft(prn_replica))
+
+
 def frequency_domain_correlation(
     antenna_samples: AntennaSamplesSpanningOneMs, prn_replica: PrnReplicaCodeSamplesSpanningOneMs
+) -> CorrelationProfile:
+    return frequency_domain_correlation_with_prn_conjugate_fft(
+        antenna_samples, get_prn_replica_conjugate_fft(prn_replica)
+    )
+
+
+def frequency_domain_correlation_with_prn_conjugate_fft(
+    antenna_samples: AntennaSamplesSpanningOneMs, prn_replica_conjugate_fft: PrnReplicaCodeConjugateFftSpanningOneMs
 ) -> CorrelationProfile:
     # Perform correlation in the frequency domain.
     # This is much more efficient than attempting to perform correlation in the time domain, as we don't need to try
     # every possible phase shift of the PRN to identify the correlation peak.
     antenna_samples_fft = np.fft.fft(antenna_samples)
-    prn_replica_fft = np.fft.fft(prn_replica)
     # Multiply by the complex conjugate of the PRN replica.
     # This aligns the phases of the antenna data and replica, and performs the cross-correlation.
-    correlation_in_frequency_domain = antenna_samples_fft * np.conj(prn_replica_fft)
+    # The conjugate FFT of the replica is passed in, since the same replica is correlated against many chunks of
+    # antenna data and only needs to be transformed once.
+    correlation_in_frequency_domain = antenna_samples_fft * prn_replica_conjugate_fft
     # Convert the correlation result back to the time domain.
     # Each value gives the correlation of the antenna data with the PRN at different phase offsets.
     # Therefore, the offset of the peak will give the phase shift of the PRN that gives maximum correlation.
@@ -79,7 +95,7 @@ def integrate_correlation_with_doppler_shifted_prn(
     antenna_data: AntennaSamplesSpanningAcquisitionIntegrationPeriodMs,
     stream_attributes: SampleProviderAttributes,
     doppler_shift: DopplerShiftHz,
-    prn_as_complex: PrnReplicaCodeSamplesSpanningOneMs,
+    prn_conjugate_fft: PrnReplicaCodeConjugateFftSpanningOneMs,
 ) -> CorrelationProfile:
     correlation_data_type = {
         IntegrationType.Coherent: complex,
@@ -96,7 +112,9 @@ def integrate_correlation_with_doppler_shifted_prn(
         doppler_shift_carrier = np.exp(-1j * math.tau * doppler_shift * integration_time_domain)
         doppler_shifted_antenna_data_chunk = chunk_that_may_contain_one_prn * doppler_shift_carrier
 
-        correlation_result = frequency_domain_correlation(doppler_shifted_antenna_data_chunk, prn_as_complex)
+        correlation_result = frequency_domain_correlation_with_prn_conjugate_fft(
+            doppler_shifted_antenna_data_chunk, prn_conjugate_fft
+        )
 
         if integration_type == IntegrationType.Coherent:
             integrated_correlation_result += correlation_result
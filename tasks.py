@@ -7,3 +7,12 @@ def autoformat(ctx: Context) -> None:
     ctx.run(f"isort .", pty=True, echo=True)
     ctx.run("black -l 120 .", pty=True, echo=True)
     print(f"Finished running auto-formatters.")
+
+
+@task
+def generate_replica_prns(ctx: Context) -> None:
+    from gypsum.gps_ca_prn_codes import write_replica_prns_asset
+
+    print(f"Generating replica PRNs asset...")
+    write_replica_prns_asset()
+    print(f"Finished generating replica PRNs asset.")